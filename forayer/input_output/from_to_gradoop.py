@@ -2,6 +2,7 @@
 import csv
 import os
 from collections import defaultdict, namedtuple
+from itertools import chain
 from typing import Dict, List, Tuple, Union
 
 from forayer.knowledge_graph import KG
@@ -194,7 +195,10 @@ def load_from_csv_datasource(
 
 
 def _gather_edge_metadata(kgs: Dict[str, KG], attribute_type_mapping: Dict = None):
-    e_metadata = nested_ddict()
+    e_metadata: Dict[str, Dict] = {}
+    # (e_type, e_prop_name) pairs whose type is settled and consistency-checked,
+    # so repeated occurrences of hot properties skip the type resolution
+    locked = set()
     for kg in kgs.values():
         for _, rel_dict in kg.rel.items():
             for _, rel_prop_dict in rel_dict.items():
@@ -203,28 +207,32 @@ def _gather_edge_metadata(kgs: Dict[str, KG], attribute_type_mapping: Dict = Non
                     # relation does not have attributes
                     # and simply has the relation name
                     # which we use as edge type for gradoop
-                    e_metadata[rel_prop_dict] = {}
+                    e_metadata.setdefault(rel_prop_dict, {})
                     continue
                 for e_type, inner_prop_dict in rel_prop_dict.items():
+                    inner = e_metadata.setdefault(e_type, {})
                     for e_prop_name, e_prop_value in inner_prop_dict.items():
+                        if (e_type, e_prop_name) in locked:
+                            continue
                         if (
                             attribute_type_mapping is not None
                             and e_type in attribute_type_mapping
                             and e_prop_name in attribute_type_mapping[e_type]
                         ):
-                            e_metadata[e_type][e_prop_name] = attribute_type_mapping[
-                                e_type
-                            ][e_prop_name]
-                        elif e_metadata[e_type][e_prop_name] != {} and e_metadata[
-                            e_type
-                        ][e_prop_name] != type(e_prop_value):
-                            raise ValueError(
-                                f"Inconsistent typing for {e_prop_name} in relation"
-                                f" type {e_type}"
-                            )
+                            inner[e_prop_name] = attribute_type_mapping[e_type][
+                                e_prop_name
+                            ]
+                            locked.add((e_type, e_prop_name))
+                        elif e_prop_name in inner:
+                            if inner[e_prop_name] != type(e_prop_value):
+                                raise ValueError(
+                                    f"Inconsistent typing for {e_prop_name} in relation"
+                                    f" type {e_type}"
+                                )
+                            locked.add((e_type, e_prop_name))
                         else:
-                            e_metadata[e_type][e_prop_name] = type(e_prop_value)
-    return nested_ddict2dict(e_metadata)
+                            inner[e_prop_name] = type(e_prop_value)
+    return e_metadata
 
 
 def _gather_vertex_metadata(
@@ -320,47 +328,90 @@ def _create_metadata(
     )
 
 
+def _enc_bool(value) -> str:
+    if value == "":
+        return ""
+    return "true" if value else "false"
+
+
+def _enc_str(value) -> str:
+    return str(value)
+
+
+def _enc_call(exp_type):
+    def _enc(value) -> str:
+        if value == "":
+            return ""
+        return str(exp_type(value))
+
+    return _enc
+
+
+def _build_encoders(metadata: Dict):
+    """Resolve the per-column type branches once per label.
+
+    Returns a dict mapping label to a list of (attr_name, encoder) tuples,
+    so the per-entity loops only call the prebuilt encoder instead of
+    re-checking the expected type for every property value.
+    """
+    encoders = {}
+    for label, (attr_names, attr_types) in metadata.items():
+        cols = []
+        for attr_name, exp_type in zip(attr_names, attr_types):
+            if exp_type == bool:
+                enc = _enc_bool
+            elif isinstance(exp_type, str):
+                enc = _enc_str
+            else:  # custom type
+                enc = _enc_call(exp_type)
+            cols.append((attr_name, enc))
+        encoders[label] = cols
+    return encoders
+
+
 def _create_vertex_lines(
     kgs: Dict[str, KG], label_attr: str, vertex_metadata: Dict, vertex_id_attr_name: str
 ):
     v_dict: Dict = {}
     vid_to_gid = {}
-    for k_name, kg in kgs.items():
-        for e_id, e_attr_dict in kg.entities.items():
-            cur_label = e_attr_dict[label_attr]
-            prop_line = []
-            for attr_name, exp_type in zip(*vertex_metadata[cur_label]):
-                if attr_name == vertex_id_attr_name:
-                    attr_value = e_id
-                else:
-                    attr_value = e_attr_dict.get(attr_name, "")
-                if attr_value != "":
-                    if exp_type == bool:
-                        attr_value = "true" if attr_value else "false"
-                    elif not isinstance(exp_type, str):  # custom type
-                        attr_value = exp_type(attr_value)
-                prop_line.append(str(attr_value))
-            prop_string = "|".join(prop_line)
-            if e_id in v_dict:
-                if v_dict[e_id].props != prop_string:
-                    raise ValueError(
-                        f"Entity {e_id} has inconsistent representation across"
-                        f" graphs:{prop_string}\n and\n {v_dict[e_id][3]}"
-                    )
-                else:
-                    v_dict[e_id].graph_ids.append(k_name)
+    encoders = _build_encoders(vertex_metadata)
+    # bind to locals to avoid repeated lookups in the hot loop
+    _label = label_attr
+    entity_iter = chain.from_iterable(
+        ((k_name, e_id, e_attr_dict) for e_id, e_attr_dict in kg.entities.items())
+        for k_name, kg in kgs.items()
+    )
+    for k_name, e_id, e_attr_dict in entity_iter:
+        cur_label = e_attr_dict[_label]
+        meta_cols = encoders[cur_label]
+        prop_line = []
+        for attr_name, enc in meta_cols:
+            if attr_name == vertex_id_attr_name:
+                prop_line.append(enc(e_id))
             else:
-                if not is_gradoop_id(e_id):
-                    grad_id = int_to_gradoop_id(len(v_dict))
-                    vid_to_gid[e_id] = grad_id
-                else:
-                    grad_id = e_id
-                v_dict[e_id] = VertexLine(grad_id, [k_name], cur_label, prop_string)
+                prop_line.append(enc(e_attr_dict.get(attr_name, "")))
+        prop_string = "|".join(prop_line)
+        if e_id in v_dict:
+            if v_dict[e_id].props != prop_string:
+                raise ValueError(
+                    f"Entity {e_id} has inconsistent representation across"
+                    f" graphs:{prop_string}\n and\n {v_dict[e_id][3]}"
+                )
+            else:
+                v_dict[e_id].graph_ids.append(k_name)
+        else:
+            if not is_gradoop_id(e_id):
+                grad_id = int_to_gradoop_id(len(v_dict))
+                vid_to_gid[e_id] = grad_id
+            else:
+                grad_id = e_id
+            v_dict[e_id] = VertexLine(grad_id, [k_name], cur_label, prop_string)
     return list(v_dict.values()), vid_to_gid
 
 
 def _create_edge_lines(kgs: Dict[str, KG], edge_metadata: Dict, vid_to_gid: Dict):
     e_dict: Dict = {}
+    encoders = _build_encoders(edge_metadata)
     for k_name, kg in kgs.items():
         for source_id, target_rel_dict in kg.rel.items():
             for target_id, rel_dict in target_rel_dict.items():
@@ -371,15 +422,10 @@ def _create_edge_lines(kgs: Dict[str, KG], edge_metadata: Dict, vid_to_gid: Dict
                     # which we use as edge type for gradoop
                     rel_dict = {rel_dict: {}}
                 for cur_label, prop_dict in rel_dict.items():
-                    prop_line = []
-                    for attr_name, exp_type in zip(*edge_metadata[cur_label]):
-                        attr_value = prop_dict.get(attr_name, "")
-                        if attr_value != "":
-                            if exp_type == bool:
-                                attr_value = "true" if attr_value else "false"
-                            elif not isinstance(exp_type, str):  # custom type
-                                attr_value = exp_type(attr_value)
-                        prop_line.append(str(attr_value))
+                    prop_line = [
+                        enc(prop_dict.get(attr_name, ""))
+                        for attr_name, enc in encoders[cur_label]
+                    ]
                     tmp_id = str(source_id) + str(target_id) + str(cur_label)
                     prop_string = "|".join(prop_line)
                     if tmp_id in e_dict:
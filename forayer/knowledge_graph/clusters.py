@@ -7,12 +7,49 @@ from copy import deepcopy
 from itertools import chain, combinations
 from typing import Any, Dict, Iterable, List, Set, Tuple, Union
 
+import numpy as np
 from forayer.knowledge_graph.graph_based_clustering import (
     connected_components_from_container,
 )
 from forayer.utils.random_help import random_generator
 
 
+def _pair_count(n: int) -> int:
+    return n * (n - 1) // 2
+
+
+def _contains_set(ch: ClusterHelper, key) -> bool:
+    index = ch._set_index
+    if index is None:
+        # build lazily and keep until the next mutation
+        index = {
+            frozenset(cluster): cluster_id
+            for cluster_id, cluster in ch.clusters.items()
+        }
+        ch._set_index = index
+    return frozenset(key) in index
+
+
+def _contains_link(ch: ClusterHelper, key) -> bool:
+    elements = ch.elements
+    if len(key) == 2 and key[0] in elements and key[1] in elements:
+        return elements[key[0]] == elements[key[1]]
+    return key in elements
+
+
+def _contains_entity(ch: ClusterHelper, key) -> bool:
+    return key in ch.elements
+
+
+# dispatch __contains__ on the key's concrete type instead of
+# walking isinstance chains on every membership check
+_CONTAINS_DISPATCH = {
+    set: _contains_set,
+    frozenset: _contains_set,
+    tuple: _contains_link,
+}
+
+
 class ClusterHelper:
     """Convenience class for entity clusters.
 
@@ -87,53 +124,104 @@ class ClusterHelper:
 
     """
 
+    __slots__ = (
+        "elements",
+        "clusters",
+        "_next_cid",
+        "_link_count",
+        "_set_index",
+        "_items_cache",
+        "_repr_cache",
+        "_str_cache",
+    )
+
+    def _invalidate_caches(self):
+        self._set_index = None
+        self._items_cache = None
+        self._repr_cache = None
+        self._str_cache = None
+
     def _contains_overlaps(self, data):
-        if len(data) > 1 and len(list(chain(*data))) > len(set.union(*data)):
-            return True
+        seen: Set = set()
+        for cluster in data:
+            if not seen.isdisjoint(cluster):
+                return True
+            seen.update(cluster)
         return False
 
-    def _from_set_list(self, data: List[Set]):
+    def _from_set_list(self, data: List[Set], disjoint: bool = False):
         # check if contains overlaps
-        if self._contains_overlaps(data):
+        if not disjoint and self._contains_overlaps(data):
             # merge overlapping
             data = connected_components_from_container(data)
-
-        for cluster_id, inner in enumerate(data):
-            if not isinstance(inner, set):
-                raise TypeError(
-                    f"Only set is allowed as list element, but got {type(inner)}"
-                )
-            inner_set = set()
-            for inner_element in inner:
-                inner_element = inner_element
-                self.elements[inner_element] = cluster_id
-                inner_set.add(inner_element)
-            self.clusters[cluster_id] = inner_set
+        else:
+            for inner in data:
+                if not isinstance(inner, set):
+                    raise TypeError(
+                        f"Only set is allowed as list element, but got {type(inner)}"
+                    )
+        # validation done: build both dicts with bulk C-level operations
+        self.clusters = {
+            cluster_id: set(inner) for cluster_id, inner in enumerate(data)
+        }
+        elements: Dict = {}
+        for cluster_id, cluster in self.clusters.items():
+            elements.update(dict.fromkeys(cluster, cluster_id))
+        self.elements = elements
+        self._next_cid = len(self.clusters)
+        self._link_count = sum(
+            _pair_count(len(cluster)) for cluster in self.clusters.values()
+        )
 
     def _from_dict(self, data: Dict):
-        for cluster_id, dict_items in enumerate(data.items()):
-            left, right = dict_items
-            if left == right:
-                raise ValueError(f"No selflinks allowed: {left} -> {right}")
-            self.elements[left] = cluster_id
-            self.clusters[cluster_id] = {left}
-            self.elements[right] = cluster_id
-            self.clusters[cluster_id].add(right)
-
-    def _from_clusters(self, data: Dict):
-        if self._contains_overlaps(data.values()):
+        if any(left == right for left, right in data.items()):
+            offending = next(left for left, right in data.items() if left == right)
+            raise ValueError(f"No selflinks allowed: {offending} -> {offending}")
+        cluster_ids = range(len(data))
+        elements = dict(zip(data.keys(), cluster_ids))
+        elements.update(zip(data.values(), cluster_ids))
+        if len(elements) != 2 * len(data):
+            # entities showing up in several links (e.g. {"a": "b", "b": "c"})
+            # form chains that have to be merged transitively
+            self._from_set_list([{left, right} for left, right in data.items()])
+            return
+        self.elements = elements
+        self.clusters = {
+            cluster_id: {left, right}
+            for cluster_id, (left, right) in enumerate(data.items())
+        }
+        self._next_cid = len(self.clusters)
+        self._link_count = len(self.clusters)
+
+    def _from_clusters(self, data: Dict, disjoint: bool = False):
+        elements: Dict = {}
+        total = 0
+        for cluster_id, cluster in data.items():
+            elements.update(dict.fromkeys(cluster, cluster_id))
+            total += len(cluster)
+        # overlapping memberships collapse in the element map,
+        # so a length mismatch reveals them without a separate scan
+        if not disjoint and len(elements) != total:
             raise ValueError(
                 "Entries with multiple memberships are not allowed, when specifying"
                 " clusters and ids explicitly"
             )
-        self.elements = {
-            e_id: cluster_id for cluster_id, cluster in data.items() for e_id in cluster
-        }
+        self.elements = elements
         self.clusters = data
+        try:
+            max_cid = max(data.keys())
+        except (TypeError, ValueError):
+            max_cid = None
+        # non-integer cluster ids cannot be incremented automatically
+        self._next_cid = max_cid + 1 if isinstance(max_cid, int) else None
+        self._link_count = sum(
+            _pair_count(len(cluster)) for cluster in self.clusters.values()
+        )
 
     def __init__(
         self,
         data: Union[List[Set], Dict] = None,
+        disjoint: bool = False,
     ):
         """Initialize a ClusterHelper object with clusters.
 
@@ -142,6 +230,9 @@ class ClusterHelper:
         data : Union[List[Set], Dict]
             Clusters either as list of sets, or dict with
             links as key, value pairs, or dict with cluster id and set of members
+        disjoint : bool
+            If True, the caller guarantees the given clusters do not overlap
+            and the overlap check (and transitive merging) is skipped.
 
         Raises
         ------
@@ -156,23 +247,40 @@ class ClusterHelper:
         """
         self.elements = {}
         self.clusters = {}
+        self._next_cid = 0
+        self._link_count = 0
+        self._set_index = None
+        self._items_cache = None
+        self._repr_cache = None
+        self._str_cache = None
         if data is None:
             return
         if not isinstance(data, (dict, list)):
             raise TypeError(f"Only list or dict allowed, but got {type(data)}")
         elif isinstance(data, list):
-            self._from_set_list(data)
+            self._from_set_list(data, disjoint=disjoint)
         elif isinstance(data, dict):
-            if isinstance(list(data.values())[0], set):
-                self._from_clusters(data)
+            try:
+                first = next(iter(data.values()))
+            except StopIteration:
+                return
+            if isinstance(first, set):
+                self._from_clusters(data, disjoint=disjoint)
             else:
                 self._from_dict(data)
 
     def __repr__(self):
-        return f"ClusterHelper(elements={str(self.elements)},clusters={str(self.clusters)})"
+        if self._repr_cache is None:
+            self._repr_cache = (
+                f"ClusterHelper(elements={str(self.elements)},"
+                f"clusters={str(self.clusters)})"
+            )
+        return self._repr_cache
 
     def __str__(self):
-        return str(self.clusters)
+        if self._str_cache is None:
+            self._str_cache = str(self.clusters)
+        return self._str_cache
 
     def info(self):
         """Print general information about this object.
@@ -207,7 +315,15 @@ class ClusterHelper:
             If always_return_set is True, will always return set
         """
         cluster = self.clusters[self.elements[key]]
-        other_members = cluster.difference({key})
+        n = len(cluster)
+        if n == 1:
+            return set()
+        if not always_return_set and n == 2:
+            # pair clusters are the common ER case: return the other
+            # member without allocating a difference set
+            one, other = cluster
+            return other if one == key else one
+        other_members = cluster - {key}
         if not always_return_set and len(other_members) == 1:
             return next(iter(other_members))
         return other_members
@@ -230,6 +346,117 @@ class ClusterHelper:
         # get pair combinations of clusters and chain generators
         return chain(*[combinations(cluster, 2) for cluster in self.clusters.values()])
 
+    def all_pairs_arrays(self, key=None) -> Tuple[List, np.ndarray, np.ndarray]:
+        """Get all entity pairs of a specific cluster or of all clusters as arrays.
+
+        Entities are encoded as integers to enable vectorized consumption,
+        e.g. for bulk similarity scoring.
+
+        Parameters
+        ----------
+        key
+            Cluster id. If None, provides pairs of all clusters.
+
+        Returns
+        -------
+        Tuple[List, np.ndarray, np.ndarray]
+            Entity list and two aligned integer arrays, where the i-th pair
+            consists of the entities with the i-th left and right index.
+
+        Examples
+        --------
+        >>> from forayer.knowledge_graph import ClusterHelper
+        >>> ch = ClusterHelper([{"a1", "b1"}, {"a2", "b2"}])
+        >>> entities, left, right = ch.all_pairs_arrays()
+        >>> pairs = [(entities[le], entities[r]) for le, r in zip(left, right)]
+        """
+        if key is not None:
+            wanted = [self.clusters[key]]
+        else:
+            wanted = self.clusters.values()
+        index: Dict = {}
+        left_parts = []
+        right_parts = []
+        for cluster in wanted:
+            ids = np.fromiter(
+                (index.setdefault(e, len(index)) for e in cluster),
+                dtype=np.int64,
+                count=len(cluster),
+            )
+            i, j = np.triu_indices(len(ids), k=1)
+            left_parts.append(ids[i])
+            right_parts.append(ids[j])
+        if not left_parts:
+            empty = np.empty(0, dtype=np.int64)
+            return [], empty, empty
+        return list(index), np.concatenate(left_parts), np.concatenate(right_parts)
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Export the entity-to-cluster assignment as two parallel arrays.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Entity ids (object dtype) and their cluster ids, aligned by
+            index. Cluster ids are int64 if all of them are integers,
+            object dtype otherwise.
+
+        Examples
+        --------
+        >>> from forayer.knowledge_graph import ClusterHelper
+        >>> ch = ClusterHelper([{"a1", "b1"}, {"a2", "b2"}])
+        >>> entities, cluster_of = ch.to_arrays()
+        """
+        count = len(self.elements)
+        # np.fromiter only supports object dtype from numpy 1.23 on,
+        # so object arrays are filled via slice assignment instead
+        entities = np.empty(count, dtype=object)
+        entities[:] = list(self.elements.keys())
+        try:
+            cluster_of = np.fromiter(
+                self.elements.values(), dtype=np.int64, count=count
+            )
+        except (TypeError, ValueError):
+            # non-integer cluster ids cannot be packed
+            cluster_of = np.empty(count, dtype=object)
+            cluster_of[:] = list(self.elements.values())
+        return entities, cluster_of
+
+    @classmethod
+    def from_arrays(
+        cls, entities: np.ndarray, cluster_of: np.ndarray
+    ) -> ClusterHelper:
+        """Create a ClusterHelper from parallel entity and cluster id arrays.
+
+        Inverse of :meth:`to_arrays`.
+
+        Parameters
+        ----------
+        entities : np.ndarray
+            entity ids
+        cluster_of : np.ndarray
+            cluster id of the entity with the same index
+
+        Returns
+        -------
+        ClusterHelper
+            ClusterHelper with the given assignment
+
+        Raises
+        ------
+        ValueError
+            if the arrays have different lengths
+        """
+        if len(entities) != len(cluster_of):
+            raise ValueError(
+                "entities and cluster_of must have the same length, but got"
+                f" {len(entities)} and {len(cluster_of)}"
+            )
+        clusters: Dict = {}
+        for e_id, cluster_id in zip(entities.tolist(), cluster_of.tolist()):
+            clusters.setdefault(cluster_id, set()).add(e_id)
+        return cls(clusters, disjoint=True)
+
     def members(self, key) -> Set:
         """Get members of a cluster.
 
@@ -292,17 +519,7 @@ class ClusterHelper:
             Either entity id, Tuple with two entities to check for a link
             between entities, or a clusters as set of entity ids
         """
-        if isinstance(key, Set):
-            return key in self.clusters.values()
-        elif (
-            isinstance(key, Tuple)
-            and len(key) == 2
-            and key[0] in self.elements
-            and key[1] in self.elements
-        ):
-            return self.elements[key[0]] == self.elements[key[1]]
-        else:
-            return key in self.elements
+        return _CONTAINS_DISPATCH.get(type(key), _contains_entity)(self, key)
 
     def __setitem__(self, key, value):
         """Not Implemented."""
@@ -327,12 +544,9 @@ class ClusterHelper:
            ClusterHelper with n clusters.
         """
         r_gen = random_generator(seed)
-        return ClusterHelper(
-            {
-                c_id: cluster
-                for c_id, cluster in r_gen.sample(list(self.clusters.items()), n)
-            }
-        )
+        if self._items_cache is None:
+            self._items_cache = list(self.clusters.items())
+        return ClusterHelper(dict(r_gen.sample(self._items_cache, n)), disjoint=True)
 
     def merge(self, c1, c2, new_id=None):
         """Merge two clusters.
@@ -350,22 +564,42 @@ class ClusterHelper:
         ------
         ValueError
             If cluster id(s) do not exist
+            Or if new_id belongs to an unrelated existing cluster
         """
         if c1 not in self.clusters or c2 not in self.clusters:
             raise ValueError("Can only merge on existing cluster ids")
-        cluster1 = self[c1]
-        cluster2 = self[c2]
-        if new_id:
-            del self.clusters[c1]
+        if new_id is None:
+            new_id = c1
+        else:
+            if new_id != c1 and new_id != c2 and new_id in self.clusters:
+                raise ValueError(f"Cluster id {new_id} already exists")
+            if (
+                isinstance(new_id, int)
+                and self._next_cid is not None
+                and new_id >= self._next_cid
+            ):
+                # keep the auto-increment counter ahead of explicitly
+                # assigned ids so add() cannot hand out a colliding id
+                self._next_cid = new_id + 1
+        elements = self.elements
+        cluster1 = self.clusters.pop(c1)
+        cluster2 = self.clusters.pop(c2)
+        # only rewrite assignments of entities whose cluster id actually changes
+        if new_id != c1:
             for e1 in cluster1:
-                del self.elements[e1]
-            self.add(cluster1, c_id=new_id)
+                elements[e1] = new_id
+        if new_id != c2:
+            for e2 in cluster2:
+                elements[e2] = new_id
+        self._link_count += len(cluster1) * len(cluster2)
+        self._invalidate_caches()
+        # grow the larger set by the smaller one
+        if len(cluster1) >= len(cluster2):
+            cluster1 |= cluster2
+            self.clusters[new_id] = cluster1
         else:
-            new_id = c1
-        del self.clusters[c2]
-        for e2 in cluster2:
-            del self.elements[e2]
-            self.add_to_cluster(new_id, e2)
+            cluster2 |= cluster1
+            self.clusters[new_id] = cluster2
 
     def add_link(self, e1, e2):
         """Add a new entity link.
@@ -404,6 +638,8 @@ class ClusterHelper:
             new_entity = e1
         self.clusters[cluster_id].add(new_entity)
         self.elements[new_entity] = cluster_id
+        self._link_count += len(self.clusters[cluster_id]) - 1
+        self._invalidate_caches()
 
     def add_to_cluster(self, c_id, new_entity):
         """Add an entity to a cluster.
@@ -430,6 +666,8 @@ class ClusterHelper:
             )
         self.elements[new_entity] = c_id
         self.clusters[c_id].add(new_entity)
+        self._link_count += len(self.clusters[c_id]) - 1
+        self._invalidate_caches()
 
     def add(
         self,
@@ -448,6 +686,11 @@ class ClusterHelper:
            If None, the next largest cluster id will be assigned
            Assuming cluster ids are integers
 
+        Returns
+        -------
+        c_id
+            Id of the newly added cluster.
+
         Raises
         ------
         ValueError
@@ -457,21 +700,86 @@ class ClusterHelper:
         """
         if not isinstance(new_entry, set):
             raise TypeError(f"Expected set, but got {type(new_entry)}")
+        if not self.elements.keys().isdisjoint(new_entry):
+            offending = next(e for e in new_entry if e in self.elements)
+            raise ValueError(f"Set contains already present entries: {offending}")
+        if c_id is None:
+            if self._next_cid is None:
+                raise ValueError(
+                    "Cluster Id cannot be automatically incremented, please provide"
+                    " it explicitly"
+                )
+            c_id = self._next_cid
+            self._next_cid += 1
         else:
-            if not len(new_entry.intersection(self.elements.keys())) == 0:
-                raise ValueError("Set contains already present entries")
-            else:
-                max_cid = max(self.clusters.keys())
-                if not isinstance(max_cid, int):
-                    raise ValueError(
-                        "Cluster Id cannot be automatically incremented, please provide"
-                        " it explicitly"
-                    )
-                cluster_id = max_cid + 1
-                self.clusters[cluster_id] = set()
-                for e in new_entry:
-                    self.elements[e] = cluster_id
-                    self.clusters[cluster_id].add(e)
+            if c_id in self.clusters:
+                raise ValueError(f"Cluster id {c_id} already exists")
+            if (
+                isinstance(c_id, int)
+                and self._next_cid is not None
+                and c_id >= self._next_cid
+            ):
+                self._next_cid = c_id + 1
+        self.clusters[c_id] = set(new_entry)
+        self.elements.update(dict.fromkeys(new_entry, c_id))
+        self._link_count += _pair_count(len(new_entry))
+        self._invalidate_caches()
+        return c_id
+
+    def add_many(self, new_entries: Iterable[Set]) -> List:
+        """Add multiple new clusters.
+
+        Validates all given clusters upfront and assigns contiguous
+        cluster ids, which is cheaper than calling :meth:`add` per cluster.
+
+        Parameters
+        ----------
+        new_entries : Iterable[Set]
+            New clusters as sets.
+
+        Returns
+        -------
+        List
+            Ids of the newly added clusters.
+
+        Raises
+        ------
+        TypeError
+            If an entry is not a set
+        ValueError
+            If an entity id is already present in another cluster,
+            the new clusters overlap each other, or cluster ids cannot
+            be inferred automatically by incrementing
+        """
+        if self._next_cid is None:
+            raise ValueError(
+                "Cluster Id cannot be automatically incremented, please provide"
+                " it explicitly"
+            )
+        new_entries = list(new_entries)
+        existing = self.elements
+        seen: Set = set()
+        for new_entry in new_entries:
+            if not isinstance(new_entry, set):
+                raise TypeError(f"Expected set, but got {type(new_entry)}")
+            if not seen.isdisjoint(new_entry):
+                raise ValueError("Sets contain overlapping entries")
+            if not existing.keys().isdisjoint(new_entry):
+                offending = next(e for e in new_entry if e in existing)
+                raise ValueError(
+                    f"Set contains already present entries: {offending}"
+                )
+            seen.update(new_entry)
+        c_ids = []
+        for new_entry in new_entries:
+            c_id = self._next_cid
+            self._next_cid += 1
+            self.clusters[c_id] = set(new_entry)
+            self.elements.update(dict.fromkeys(new_entry, c_id))
+            self._link_count += _pair_count(len(new_entry))
+            c_ids.append(c_id)
+        self._invalidate_caches()
+        return c_ids
 
     def remove(self, entry: str):
         """Remove an entity.
@@ -484,13 +792,45 @@ class ClusterHelper:
         cluster_id = self.elements[entry]
         del self.elements[entry]
         cluster = self.clusters[cluster_id]
+        self._link_count -= len(cluster) - 1
+        self._invalidate_caches()
         if len(cluster) == 2:
-            for member in cluster:
-                if member != entry:
-                    del self.elements[member]
+            one, other = cluster
+            if other == entry:
+                other = one
+            del self.elements[other]
             del self.clusters[cluster_id]
         else:
-            self.clusters[cluster_id].remove(entry)
+            cluster.remove(entry)
+
+    def remove_many(self, entries: Iterable[str]):
+        """Remove multiple entities.
+
+        Groups the entities by their cluster first, so each affected
+        cluster is touched once instead of per removed entity.
+
+        Parameters
+        ----------
+        entries : Iterable[str]
+            entities to remove
+        """
+        by_cluster: Dict = {}
+        for entry in entries:
+            by_cluster.setdefault(self.elements[entry], set()).add(entry)
+        for cluster_id, removed in by_cluster.items():
+            cluster = self.clusters[cluster_id]
+            self._link_count -= _pair_count(len(cluster)) - _pair_count(
+                len(cluster) - len(removed)
+            )
+            cluster -= removed
+            for e in removed:
+                del self.elements[e]
+            if len(cluster) < 2:
+                # like remove, do not keep clusters without links around
+                for e in cluster:
+                    del self.elements[e]
+                del self.clusters[cluster_id]
+        self._invalidate_caches()
 
     def remove_cluster(self, cluster_id):
         """Remove an entire cluster with the given cluster id.
@@ -501,12 +841,86 @@ class ClusterHelper:
             id of the cluster to remove
         """
         cluster_elements = self.clusters[cluster_id]
-        for e in iter(cluster_elements):
-            del self.elements[e]
+        self._link_count -= _pair_count(len(cluster_elements))
+        self._invalidate_caches()
+        if len(cluster_elements) * 8 > len(self.elements):
+            # rebuilding in one C-level pass beats per-element deletion
+            # when the cluster is a sizeable fraction of all entities
+            self.elements = {
+                e: c_id for e, c_id in self.elements.items() if c_id != cluster_id
+            }
+        else:
+            for e in iter(cluster_elements):
+                del self.elements[e]
         del self.clusters[cluster_id]
 
+    def __getstate__(self):
+        """Pickle as a compact entity table instead of two redundant dicts.
+
+        The clusters dict mirrors the elements dict, so only the entity
+        names and their cluster assignments are serialized; integer
+        cluster ids are packed into a flat numpy array.
+        """
+        cluster_of: Union[np.ndarray, List] = list(self.elements.values())
+        try:
+            cluster_of = np.fromiter(
+                cluster_of, dtype=np.int64, count=len(cluster_of)
+            )
+        except (TypeError, ValueError):
+            # non-integer cluster ids cannot be packed
+            pass
+        return {
+            "names": list(self.elements.keys()),
+            "cluster_of": cluster_of,
+            "next_cid": self._next_cid,
+        }
+
+    def __setstate__(self, state):
+        """Rebuild both dicts from the compact entity table."""
+        if "cluster_of" not in state:
+            # state dict of a release before the compact pickle format,
+            # which simply pickled the instance __dict__
+            self.elements = state["elements"]
+            self.clusters = state["clusters"]
+            if not self.clusters:
+                self._next_cid = 0
+            else:
+                try:
+                    max_cid = max(self.clusters.keys())
+                except (TypeError, ValueError):
+                    max_cid = None
+                self._next_cid = max_cid + 1 if isinstance(max_cid, int) else None
+            self._link_count = sum(
+                _pair_count(len(cluster)) for cluster in self.clusters.values()
+            )
+            self._invalidate_caches()
+            return
+        cluster_of = state["cluster_of"]
+        if isinstance(cluster_of, np.ndarray):
+            cluster_of = map(int, cluster_of)
+        self.elements = dict(zip(state["names"], cluster_of))
+        clusters: Dict = {}
+        for e_id, cluster_id in self.elements.items():
+            clusters.setdefault(cluster_id, set()).add(e_id)
+        self.clusters = clusters
+        self._next_cid = state["next_cid"]
+        self._link_count = sum(
+            _pair_count(len(cluster)) for cluster in clusters.values()
+        )
+        self._invalidate_caches()
+
     def __eq__(self, other):
         if isinstance(other, ClusterHelper):
+            if self is other:
+                return True
+            # cheap invariants rule out the common "different" case
+            # before the full dict-of-sets comparison
+            if (
+                len(self.clusters) != len(other.clusters)
+                or len(self.elements) != len(other.elements)
+                or self._link_count != other._link_count
+            ):
+                return False
             return (self.clusters == other.clusters) and (
                 self.elements == other.elements
             )
@@ -523,6 +937,8 @@ class ClusterHelper:
         cloned = ClusterHelper()
         cloned.elements = deepcopy(self.elements)
         cloned.clusters = deepcopy(self.clusters)
+        cloned._next_cid = self._next_cid
+        cloned._link_count = self._link_count
         return cloned
 
     def __len__(self):
@@ -531,9 +947,4 @@ class ClusterHelper:
     @property
     def number_of_links(self):
         """Return the total number of links."""
-
-        def number_of_pairs_in_set(s):
-            n = len(s)
-            return int(n * (n - 1) / 2)
-
-        return sum(map(number_of_pairs_in_set, self.clusters.values()))
+        return self._link_count
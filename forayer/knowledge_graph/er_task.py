@@ -121,24 +121,26 @@ class ERTask:
         sample_clusters = self.clusters.sample(n, seed=r_gen)
         entity_ids = list(sample_clusters.elements.keys())
         if unmatched is not None:
-            unm_ent: Union[Set, List] = set()
             no_match_entities: List = self.without_match()
-            if len(no_match_entities) >= n:
-                unm_ent = r_gen.sample(no_match_entities)
+            if len(no_match_entities) >= unmatched:
+                unm_ent: List = r_gen.sample(no_match_entities, unmatched)
             else:
                 unm_ent = no_match_entities
+                unm_ent_set = set(unm_ent)
+                entity_id_set = set(entity_ids)
                 for cand in self.entity_ids:
                     if len(unm_ent) == unmatched:
                         break
-                    if cand not in self.clusters:
+                    if cand in unm_ent_set or cand in entity_id_set:
+                        continue
+                    cand_links = self.clusters.links(cand, always_return_set=True)
+                    if not any(
+                        c in entity_id_set or c in unm_ent_set for c in cand_links
+                    ):
                         unm_ent.append(cand)
-                    elif cand not in entity_ids:
-                        cand_links = self.clusters.links(cand, always_return_set=True)
-                        if not any(c in entity_ids or c in unm_ent for c in cand_links):
-                            unm_ent.append(cand)
-            entity_ids.extend(list(unm_ent))
-        for _, k in self.kgs.items():
-            sampled_kgs = [k.subgraph(entity_ids) for k_name, k in self.kgs.items()]
+                        unm_ent_set.add(cand)
+            entity_ids.extend(unm_ent)
+        sampled_kgs = [k.subgraph(entity_ids) for k in self.kgs.values()]
         return ERTask(kgs=sampled_kgs, clusters=sample_clusters)
 
     @property
@@ -165,7 +167,15 @@ class ERTask:
         Dict[str, Dict]
             all entities
         """
-        all_attr_ent = reduce(dict_merge, [k.entities for k in self.kgs.values()])
+        all_attr_ent: Dict = {}
+        total = 0
+        for kg in self.kgs.values():
+            all_attr_ent.update(kg.entities)
+            total += len(kg.entities)
+        if len(all_attr_ent) != total:
+            # entity ids overlap between KGs: redo with the conflict-aware
+            # deep merge instead of silently overwriting
+            all_attr_ent = reduce(dict_merge, [k.entities for k in self.kgs.values()])
         if not ignore_only_relational:
             for kg in self.kgs.values():
                 for e in kg.rel:
@@ -178,7 +188,9 @@ class ERTask:
 
     def without_match(self):
         """Return ids of entities without matches in given gold standard."""
-        return [e for e in self.entity_ids if e not in self.clusters]
+        # single C-level set difference instead of one
+        # ClusterHelper.__contains__ dispatch per entity
+        return list(self.entity_ids - self.clusters.elements.keys())
 
     def __len__(self):
         return sum([len(k) for k in self.kgs.values()])
@@ -198,22 +210,16 @@ class ERTask:
         """
         if self.__inv_attr is None:
             attr_to_kg_to_attr_name_to_ent: Dict = {}
+            # bound method in a local: the innermost loop then only does
+            # LOAD_FAST instead of a dict attribute lookup per triple
+            outer_setdefault = attr_to_kg_to_attr_name_to_ent.setdefault
             for kg_name, kg in self.kgs.items():
                 for ent_id, ent_attr_dict in kg.entities.items():
                     for attr_name, attr_value in ent_attr_dict.items():
-                        if attr_value not in attr_to_kg_to_attr_name_to_ent:
-                            attr_to_kg_to_attr_name_to_ent[attr_value] = {}
-                        if kg_name not in attr_to_kg_to_attr_name_to_ent[attr_value]:
-                            attr_to_kg_to_attr_name_to_ent[attr_value][kg_name] = {}
-                        if (
-                            attr_name
-                            not in attr_to_kg_to_attr_name_to_ent[attr_value][kg_name]
-                        ):
-                            attr_to_kg_to_attr_name_to_ent[attr_value][kg_name][
-                                attr_name
-                            ] = []
-                        attr_to_kg_to_attr_name_to_ent[attr_value][kg_name][
-                            attr_name
-                        ].append(ent_id)
+                        # setdefault hashes each key once instead of the
+                        # check-then-index pattern hashing it up to three times
+                        outer_setdefault(attr_value, {}).setdefault(
+                            kg_name, {}
+                        ).setdefault(attr_name, []).append(ent_id)
             self.__inv_attr = attr_to_kg_to_attr_name_to_ent
         return self.__inv_attr
@@ -40,7 +40,88 @@ def to_edges(elements):
         last = current
 
 
+class UnionFind:
+    """Disjoint-set structure over hashable elements.
+
+    Uses path compression and union by size, which makes a sequence of
+    union/find operations effectively linear in the number of elements.
+    """
+
+    def __init__(self):
+        self._parent = {}
+        self._size = {}
+
+    def find(self, x):
+        """Return the representative of the set containing x.
+
+        Unknown elements are added as their own singleton set.
+
+        Parameters
+        ----------
+        x
+            element to look up
+        """
+        parent = self._parent
+        if x not in parent:
+            parent[x] = x
+            self._size[x] = 1
+            return x
+        # path halving: compress while walking up in a single pass
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """Merge the sets containing x and y.
+
+        Parameters
+        ----------
+        x
+            element of one set to merge
+        y
+            element of other set to merge
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return
+        # union by size: attach the smaller tree below the larger
+        if self._size[root_x] < self._size[root_y]:
+            root_x, root_y = root_y, root_x
+        self._parent[root_y] = root_x
+        self._size[root_x] += self._size[root_y]
+
+    def components(self):
+        """Return the disjoint sets as an iterable of sets."""
+        comps = {}
+        for x in self._parent:
+            comps.setdefault(self.find(x), set()).add(x)
+        return comps.values()
+
+
 def connected_components_from_container(elements):
-    # https://stackoverflow.com/a/4843408
-    G = to_graph(elements)
-    return connected_components(G)
+    """Merge overlapping containers transitively.
+
+    Parameters
+    ----------
+    elements
+        Container with containers of elements
+
+    Returns
+    -------
+    Iterable of the merged element sets.
+    """
+    uf = UnionFind()
+    # unique sentinel so a container whose first element is None
+    # is not mistaken for an empty container
+    _missing = object()
+    for part in elements:
+        part_iter = iter(part)
+        first = next(part_iter, _missing)
+        if first is _missing:
+            continue
+        uf.find(first)
+        for other in part_iter:
+            uf.union(first, other)
+    return uf.components()
@@ -6,10 +6,12 @@ import warnings
 from collections import defaultdict
 from copy import deepcopy
 from itertools import chain
+from operator import itemgetter
 from typing import Any, Dict, Iterable, List, Set, Union
 
+import numpy as np
 from forayer.transformation.word_embedding import AttributeVectorizer
-from forayer.utils.dict_help import dict_merge, nested_ddict2dict
+from forayer.utils.dict_help import dict_merge
 from forayer.utils.random_help import random_generator
 from rdflib import Graph, Literal, URIRef
 from tqdm import tqdm
@@ -18,6 +20,17 @@ from tqdm import tqdm
 class KG:
     """KG class holding entities and their attributes and relations between entities."""
 
+    __slots__ = (
+        "entities",
+        "rel",
+        "_inv_rel",
+        "name",
+        "_attr_index",
+        "_search_str_cache",
+        "_adj",
+        "_info_cache",
+    )
+
     def __init__(
         self,
         entities: Dict[Any, Dict[Any, Any]],
@@ -49,23 +62,28 @@ class KG:
         """
         self.entities = entities
         self.rel = rel if rel is not None else {}
-        inv_rel: Dict[Any, Set] = {}
+        inv_rel: Dict[Any, Set] = defaultdict(set)
         if rel is not None:
             for left_ent, right_ent_rel in rel.items():
-                for right_ent, _ in right_ent_rel.items():
-                    if right_ent not in inv_rel:
-                        inv_rel[right_ent] = set()
+                for right_ent in right_ent_rel:
                     inv_rel[right_ent].add(left_ent)
-        self._inv_rel = inv_rel
+        # plain dict so missing-key lookups keep raising KeyError
+        self._inv_rel = dict(inv_rel)
         self.name = name
+        self._attr_index: Dict[Any, Dict[Any, Set[Any]]] = None
+        self._search_str_cache: List = None
+        self._adj: Dict[Any, Set[Any]] = None
+        self._info_cache: str = None
 
     def __eq__(self, other):
         if isinstance(other, KG):
-            return (
-                self.entities == other.entities
-                and self.rel == other.rel
-                and self.name == other.name
-            )
+            if self is other:
+                return True
+            # cheap checks first so mismatched KGs bail out before the
+            # full dict comparisons
+            if self.name != other.name or len(self.entities) != len(other.entities):
+                return False
+            return self.entities == other.entities and self.rel == other.rel
         return False
 
     def clone(self) -> KG:
@@ -81,6 +99,29 @@ class KG:
         cloned_name = deepcopy(self.name)
         return KG(entities=cloned_entities, rel=cloned_rel, name=cloned_name)
 
+    def _build_search_index(self):
+        attr_index: Dict[Any, Dict[Any, Set[Any]]] = {}
+        str_cache = []
+        for ent_id, attr_dict in self.entities.items():
+            for attr_name, value in attr_dict.items():
+                str_cache.append((ent_id, attr_name, str(value)))
+                try:
+                    attr_index.setdefault(attr_name, {}).setdefault(value, set()).add(
+                        ent_id
+                    )
+                except TypeError:
+                    # unhashable values (e.g. sets) can never equal a
+                    # string query, so exact search may skip them
+                    pass
+        self._attr_index = attr_index
+        self._search_str_cache = str_cache
+
+    def _invalidate_caches(self):
+        self._attr_index = None
+        self._search_str_cache = None
+        self._adj = None
+        self._info_cache = None
+
     def search(self, query, attr=None, exact=False):
         """Search for entities with specific attribute value.
 
@@ -117,19 +158,24 @@ class KG:
         query = str(query)
         if attr is not None and not isinstance(attr, list):
             attr = [attr]
+        if self._attr_index is None:
+            self._build_search_index()
         result = {}
-        for ent_id, attr_dict in self.entities.items():
-            if attr is not None:
-                filtered_attr_dict = {k: v for k, v in attr_dict.items() if k in attr}
-            else:
-                filtered_attr_dict = attr_dict
-            if exact:
-                if query in filtered_attr_dict.values():
-                    result[ent_id] = attr_dict
-            else:
-                for _, value in filtered_attr_dict.items():
-                    if query in str(value):
-                        result[ent_id] = attr_dict
+        if exact:
+            wanted_attrs = self._attr_index.keys() if attr is None else attr
+            for attr_name in wanted_attrs:
+                value_index = self._attr_index.get(attr_name)
+                if value_index is None:
+                    continue
+                for ent_id in value_index.get(query, ()):
+                    result[ent_id] = self.entities[ent_id]
+        else:
+            attr_set = None if attr is None else set(attr)
+            for ent_id, attr_name, str_value in self._search_str_cache:
+                if attr_set is not None and attr_name not in attr_set:
+                    continue
+                if query in str_value:
+                    result[ent_id] = self.entities[ent_id]
         return result
 
     def with_attr(self, attr: str):
@@ -190,21 +236,28 @@ class KG:
         >>> kg.subgraph(["e1","e3"])
         KG(entities={'e1': {'a': 1}, 'e3': {}}, rel={'e1': {'e3': 'rel'}}, name=None)
         """
+        # iterate over wanted instead of the whole KG, so the cost scales
+        # with the size of the subgraph and not the size of the graph;
+        # dict.fromkeys keeps O(1) membership while preserving the caller's
+        # order, so the result does not depend on set iteration order
+        wanted = dict.fromkeys(wanted)
         wanted_entities = {
-            ent_id: attr_dict
-            for ent_id, attr_dict in self.entities.items()
-            if ent_id in wanted
+            ent_id: self.entities[ent_id]
+            for ent_id in wanted
+            if ent_id in self.entities
         }
-        wanted_rel: Dict = defaultdict(dict)
-        entities_in_rel = set()
-        for ent_id, right_rel_dict in self.rel.items():
-            if ent_id in wanted:
-                for right_ent_id, rel_dict in right_rel_dict.items():
-                    if right_ent_id in wanted:
-                        entities_in_rel.add(ent_id)
-                        entities_in_rel.add(right_ent_id)
-                        # TODO what about multi-value
-                        wanted_rel[ent_id][right_ent_id] = rel_dict
+        wanted_rel: Dict = {}
+        for ent_id in wanted:
+            if ent_id not in self.rel:
+                continue
+            inner = {
+                right_ent_id: rel_dict
+                # TODO what about multi-value
+                for right_ent_id, rel_dict in self.rel[ent_id].items()
+                if right_ent_id in wanted
+            }
+            if inner:
+                wanted_rel[ent_id] = inner
         # add entities without attributes, that only show up in relationships
         # that point outside the subgraph and therefore were missed
         for w in wanted:
@@ -212,9 +265,7 @@ class KG:
                 w in self.entities or w in self.rel or w in self._inv_rel
             ):
                 wanted_entities[w] = {}
-        return KG(
-            entities=wanted_entities, rel=nested_ddict2dict(wanted_rel), name=self.name
-        )
+        return KG(entities=wanted_entities, rel=wanted_rel, name=self.name)
 
     def add_entity(self, e_id: str, e_attr: Dict, overwrite: bool = False):
         """Add an entity to the knowledge graph.
@@ -236,6 +287,7 @@ class KG:
         if e_id in self.entities and not overwrite:
             raise ValueError(f"{e_id} already exists: {self.entities[e_id]}")
         self.entities[e_id] = e_attr
+        self._invalidate_caches()
 
     def remove_entity(self, e_id: str):
         """Remove the entity with the id.
@@ -251,6 +303,7 @@ class KG:
             If no entity with this id exists
         """
         del self.entities[e_id]
+        self._invalidate_caches()
         if e_id in self.rel:
             del self.rel[e_id]
         if e_id in self._inv_rel:
@@ -297,7 +350,7 @@ class KG:
             and value == self.rel[source][target]
         ):
             return False
-        elif source not in self.rel:
+        if source not in self.rel:
             self.rel[source] = {target: value}
             self._add_inv_rel(target, source)
         elif target not in self.rel[source]:
@@ -312,6 +365,7 @@ class KG:
                     current_value = [current_value]
                 current_value.append(value)
                 self.rel[source][target] = current_value
+        self._invalidate_caches()
         return True
 
     def remove_rel(self, source: str, target: str, value=None):
@@ -333,6 +387,7 @@ class KG:
         ValueError
             If value does not exist in relationship
         """
+        self._invalidate_caches()
         if value is not None:
             current_value = self.rel[source][target]
             value_not_found_msg = (
@@ -409,7 +464,13 @@ class KG:
             attributes of entity
         """
         if isinstance(key, list):
-            return {e_id: self.entities[e_id] for e_id in key}
+            if not key:
+                return {}
+            # itemgetter runs the lookup loop at C level
+            values = itemgetter(*key)(self.entities)
+            if len(key) == 1:
+                values = (values,)
+            return dict(zip(key, values))
         return self.entities[key]
 
     def __contains__(self, key):
@@ -443,15 +504,16 @@ class KG:
         neighbors: Union[Set[Any], Dict[Any, Dict[Any,Any]]]
             entity dict of neighbors, if only_id is true returns neighbor ids as set
         """
-        try:
-            n_to_right = set(self.rel[entity_id].keys())
-        except KeyError:
-            n_to_right = set()
-        try:
-            n_to_left = self._inv_rel[entity_id]
-        except KeyError:
-            n_to_left = set()
-        result_ids = n_to_right.union(n_to_left)
+        if self._adj is None:
+            # amortize repeated neighbor queries with a lazily built
+            # undirected adjacency map
+            adj: Dict[Any, Set[Any]] = defaultdict(set)
+            for left_ent, right_ent_rel in self.rel.items():
+                for right_ent in right_ent_rel:
+                    adj[left_ent].add(right_ent)
+                    adj[right_ent].add(left_ent)
+            self._adj = {ent_id: frozenset(n) for ent_id, n in adj.items()}
+        result_ids = self._adj.get(entity_id, frozenset())
         if only_id:
             return result_ids
         return self[list(result_ids)]
@@ -465,11 +527,8 @@ class KG:
         Set[Any]
             Ids of all entities.
         """
-        return (
-            set(self.entities.keys())
-            .union(set(self.rel.keys()))
-            .union(set(self._inv_rel.keys()))
-        )
+        # dict key views support set ops without copying first
+        return self.entities.keys() | self.rel.keys() | self._inv_rel.keys()
 
     @property
     def attribute_names(self) -> Set[str]:
@@ -493,14 +552,15 @@ class KG:
         Set[Any]
             Attribute values as set
         """
-        attr_values = set()
-        for _, attr_dict in self.entities.items():
-            for _, attr_value in attr_dict.items():
-                if isinstance(attr_value, set):
-                    for inner_attr in attr_value:
-                        attr_values.add(inner_attr)
+        attr_values: Set = set()
+        update = attr_values.update
+        add = attr_values.add
+        for attr_dict in self.entities.values():
+            for attr_value in attr_dict.values():
+                if isinstance(attr_value, (set, list)):
+                    update(attr_value)
                 else:
-                    attr_values.add(attr_value)
+                    add(attr_value)
         return attr_values
 
     @property
@@ -561,18 +621,21 @@ class KG:
         str
             information about number of entities, attributes and values
         """
+        if self._info_cache is not None:
+            return self._info_cache
         num_ent = len(self.entities.keys())
         num_attr_name = len(self.entities.values())
 
         num_attr_values = len(self.attribute_values)
-        num_ent_rel = len(set(self.rel.keys()).union(set(self._inv_rel.keys())))
+        num_ent_rel = len(self.rel.keys() | self._inv_rel.keys())
         num_rel = len(self._rel_signatures())
         name = "KG" if self.name is None else self.name
-        return (
+        self._info_cache = (
             f"{name}: (# entities: {len(self)}, # entities_with_rel: {num_ent_rel}, #"
             f" rel: {num_rel}, # entities_with_attributes: {num_ent}, #"
             f" attributes: {num_attr_name}, # attr_values: {num_attr_values})"
         )
+        return self._info_cache
 
     def to_rdflib(self, prefix: str = "", attr_mapping: dict = None):
         """Transform to rdflib graph.
@@ -614,21 +677,28 @@ class KG:
         rdflib.term.Literal('first entity')
         """
 
-        def get_predicate(raw, attr_mapping):
-            substitute = attr_mapping.get(raw, raw)
-            if isinstance(substitute, URIRef):
-                return substitute
-            return URIRef(substitute)
-
         rdf_g = Graph()
         if attr_mapping is None:
             attr_mapping = {}
+        # attribute/relation vocabularies are tiny compared to the number
+        # of triples, so memoize the URIRef per raw predicate
+        pred_cache: Dict[Any, URIRef] = {}
+
+        def get_predicate(raw):
+            predicate = pred_cache.get(raw)
+            if predicate is None:
+                substitute = attr_mapping.get(raw, raw)
+                if not isinstance(substitute, URIRef):
+                    substitute = URIRef(substitute)
+                predicate = pred_cache[raw] = substitute
+            return predicate
+
         for e_id, attr_dict in tqdm(
-            self.entities.items(), desc="Transforming entities"
+            self.entities.items(), desc="Transforming entities", mininterval=1.0
         ):
+            subject = URIRef(prefix + e_id)
             for attr_name, attr_value in attr_dict.items():
-                subject = URIRef(prefix + e_id)
-                predicate = get_predicate(attr_name, attr_mapping)
+                predicate = get_predicate(attr_name)
                 if isinstance(attr_value, (set, list)):
                     for inner_attr_val in attr_value:
                         object = Literal(inner_attr_val)
@@ -637,9 +707,9 @@ class KG:
                     object = Literal(attr_value)
                     rdf_g.add((subject, predicate, object))
         for left_id, right_id_rel in self.rel.items():
+            subject = URIRef(prefix + left_id)
             for right_id, rel in right_id_rel.items():
-                subject = URIRef(prefix + left_id)
-                predicate = get_predicate(rel, attr_mapping)
+                predicate = get_predicate(rel)
                 object = URIRef(prefix + right_id)
                 rdf_g.add((subject, predicate, object))
         return rdf_g
@@ -652,22 +722,21 @@ class KG:
     def __len__(self):
         # some datasets have entities without attributes that
         # only show up in the relations
-        return len(
-            set(self.entities)
-            .union(set(self.rel.keys()))
-            .union(set(self._inv_rel.keys()))
-        )
+        return len(self.entities.keys() | self.rel.keys() | self._inv_rel.keys())
 
 
 class AttributeEmbeddedKG(KG):
     """KG class holding entities and their embedded attributes as well as relations between entities."""
 
+    __slots__ = ("vectorizer", "_ignored", "_seen")
+
     def __init__(
         self,
         entities: Dict[Any, Dict[Any, Any]],
         rel: Dict[Any, Dict[Any, Any]],
         vectorizer: AttributeVectorizer,
         name: str = None,
+        dtype=None,
     ):
         """Initialize an attribute embeded KG object.
 
@@ -685,6 +754,9 @@ class AttributeEmbeddedKG(KG):
             an attribute vectorizer to use for retrieving the embeddings
         name : str, optional
             name of the kg, default is None
+        dtype : optional
+            if provided, cast the token embeddings to this numpy dtype
+            (e.g. np.float16) to trade precision for memory
 
         Examples
         --------
@@ -714,8 +786,17 @@ class AttributeEmbeddedKG(KG):
         self.vectorizer.reset_token_count()
         attr_embedded_entities = {
             e_id: self.vectorizer.vectorize_entity_attributes(ent_attr)
-            for e_id, ent_attr in tqdm(entities.items(), desc="Vectorizing attributes")
+            for e_id, ent_attr in tqdm(
+                entities.items(), desc="Vectorizing attributes", mininterval=1.0
+            )
         }
+        if dtype is not None:
+            for ent_attr in attr_embedded_entities.values():
+                for attr_name, token_vecs in ent_attr.items():
+                    ent_attr[attr_name] = [
+                        vec.astype(dtype) if isinstance(vec, np.ndarray) else vec
+                        for vec in token_vecs
+                    ]
         if self.vectorizer.ignored_tokens > 0:
             warnings.warn(
                 f"{self.vectorizer.ignored_tokens}/{self.vectorizer.seen_tokens} tokens"
@@ -736,19 +817,24 @@ class AttributeEmbeddedKG(KG):
         str
             information about number of entities, attributes and embedded attributes
         """
+        if self._info_cache is not None:
+            return self._info_cache
         num_ent = len(self.entities.keys())
         num_attr_name = len(self.entities.values())
-        num_ent_rel = len(set(self.rel.keys()).union(set(self._inv_rel.keys())))
+        num_ent_rel = len(self.rel.keys() | self._inv_rel.keys())
         name = "KG" if self.name is None else self.name
-        return (
+        self._info_cache = (
             f"{name}: (# entities_with_rel: {num_ent_rel}, # rel: {len(self.rel)}, #"
             f" entities_with_attributes: {num_ent}, # attributes: {num_attr_name},"
             f" {self._ignored}/{self._seen} tokens"
             " have no pre-trained embedding and were replaced by np.NaN)"
         )
+        return self._info_cache
 
     @classmethod
-    def from_kg(cls, kg: KG, vectorizer: AttributeVectorizer) -> AttributeEmbeddedKG:
+    def from_kg(
+        cls, kg: KG, vectorizer: AttributeVectorizer, dtype=None
+    ) -> AttributeEmbeddedKG:
         """Initialize an attribute embedded KG object from a knowledge graph object.
 
         Parameters
@@ -757,6 +843,9 @@ class AttributeEmbeddedKG(KG):
             a pre-populated knowledge graph
         vectorizer: AttributeVectorizer
             an attribute vectorizer to use for retrieving the embeddings
+        dtype : optional
+            if provided, cast the token embeddings to this numpy dtype
+            (e.g. np.float16) to trade precision for memory
 
         Returns
         -------
@@ -764,5 +853,9 @@ class AttributeEmbeddedKG(KG):
             the given KG with vectorized attribute values
         """
         return AttributeEmbeddedKG(
-            entities=kg.entities, rel=kg.rel, vectorizer=vectorizer, name=kg.name
+            entities=kg.entities,
+            rel=kg.rel,
+            vectorizer=vectorizer,
+            name=kg.name,
+            dtype=dtype,
         )
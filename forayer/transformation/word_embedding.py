@@ -156,14 +156,21 @@ class AttributeVectorizer:
         Ignored tokens will be set to np.NaN
         """
         vectorized = []
+        append = vectorized.append
+        wv = self.wv
+        vocab = self.vocab
         _number_of_tokens = 0  # initialize before in case loop is not executed
         for _number_of_tokens, word in enumerate(self.tokenizer(sentence), start=1):
-            if word in self.wv:
-                vectorized.append(self.wv[word])
-            else:
-                vectorized.append(np.NaN)
-                self.ignored_tokens += 1
-                logging.debug(f"Did not find embedding for {word}, ignoring")
+            cached = vocab.get(word)
+            if cached is None:
+                if word in wv:
+                    cached = vocab[word] = wv[word]
+                else:
+                    append(np.NaN)
+                    self.ignored_tokens += 1
+                    logging.debug(f"Did not find embedding for {word}, ignoring")
+                    continue
+            append(cached)
         self.seen_tokens += _number_of_tokens
         return vectorized
 
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 from forayer.knowledge_graph import ClusterHelper
 
@@ -113,6 +116,12 @@ def test_merge():
     cluster.merge(0, 1, new_id=2)
     assert cluster == ClusterHelper({2: {1, 2, 3, 4}})
 
+    # new_id must not clobber an unrelated cluster
+    cluster = ClusterHelper({0: {1, 2}, 1: {3, 4}, 2: {5, 6}})
+    with pytest.raises(ValueError):
+        cluster.merge(0, 1, new_id=2)
+    assert cluster == ClusterHelper({0: {1, 2}, 1: {3, 4}, 2: {5, 6}})
+
 
 def test_add_link():
     cluster = ClusterHelper({0: {1, 2}})
@@ -257,3 +266,87 @@ def test_clone():
     assert ch == cloned
     cloned.remove(2)
     assert ch != cloned
+
+
+def test_to_from_arrays():
+    ch = ClusterHelper({0: {"a1", "1", "b1", "b3"}, 1: {"c1", "c2"}})
+    entities, cluster_of = ch.to_arrays()
+    assert len(entities) == len(cluster_of) == 6
+    assert ClusterHelper.from_arrays(entities, cluster_of) == ch
+
+
+def test_add_many():
+    ch = ClusterHelper([{"a1", "b1"}])
+    new_ids = ch.add_many([{"a2", "b2"}, {"a3", "b3", "c3"}])
+    assert new_ids == [1, 2]
+    assert ch.clusters == {
+        0: {"a1", "b1"},
+        1: {"a2", "b2"},
+        2: {"a3", "b3", "c3"},
+    }
+    assert ch.elements["c3"] == 2
+    assert ch.number_of_links == 1 + 1 + 3
+
+    # non-set entry
+    with pytest.raises(TypeError):
+        ch.add_many([["d1", "d2"]])
+    # overlap between new entries
+    with pytest.raises(ValueError):
+        ch.add_many([{"d1", "d2"}, {"d2", "d3"}])
+    # already present entity
+    with pytest.raises(ValueError):
+        ch.add_many([{"d1", "a1"}])
+    # failed validation must not have added anything
+    assert len(ch) == 3
+
+
+def test_remove_many():
+    ch = ClusterHelper([{"a1", "b1"}, {"a2", "b2", "c2"}, {"a3", "b3"}])
+    ch.remove_many(["a2", "a3"])
+    # cluster 2 fell below two members and is dissolved
+    assert ch.clusters == {0: {"a1", "b1"}, 1: {"b2", "c2"}}
+    assert "b3" not in ch.elements
+    assert ch.number_of_links == 2
+
+    with pytest.raises(KeyError):
+        ch.remove_many(["not_present"])
+
+
+def test_pickle_roundtrip():
+    ch = ClusterHelper({0: {"a1", "1", "b1", "b3"}, 1: {2, 3}, 2: {"a3", "3"}})
+    unpickled = pickle.loads(pickle.dumps(ch))
+    assert unpickled == ch
+    assert unpickled.number_of_links == ch.number_of_links
+    assert unpickled._next_cid == ch._next_cid
+
+    deepcopied = copy.deepcopy(ch)
+    assert deepcopied == ch
+    assert deepcopied.number_of_links == ch.number_of_links
+    assert deepcopied._next_cid == ch._next_cid
+
+    # state dict of a release that pickled the instance __dict__
+    legacy = ClusterHelper.__new__(ClusterHelper)
+    legacy.__setstate__(
+        {
+            "elements": {"a1": 0, "1": 0, "a2": 1, "2": 1},
+            "clusters": {0: {"a1", "1"}, 1: {"a2", "2"}},
+        }
+    )
+    assert legacy == ClusterHelper({0: {"a1", "1"}, 1: {"a2", "2"}})
+    assert legacy.number_of_links == 2
+    assert legacy._next_cid == 2
+
+
+def test_all_pairs_arrays():
+    clusters = {0: {"a1", "1", "b1", "b3"}, 1: {"a2", "2"}, 2: {"a3", "3"}}
+    ch = ClusterHelper(clusters)
+    entities, left, right = ch.all_pairs_arrays()
+    decoded = [(entities[le], entities[r]) for le, r in zip(left, right)]
+    assert_equal_pairs(decoded, list(ch.all_pairs()))
+
+    entities, left, right = ch.all_pairs_arrays(key=0)
+    decoded = [(entities[le], entities[r]) for le, r in zip(left, right)]
+    assert_equal_pairs(decoded, list(ch.all_pairs(0)))
+
+    entities, left, right = ClusterHelper().all_pairs_arrays()
+    assert entities == [] and len(left) == 0 and len(right) == 0